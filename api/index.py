@@ -1,25 +1,109 @@
-"""Vercel serverless handler: loads jobs from Google Sheet and returns HTML."""
+"""Vercel serverless handler: serves jobs from a snapshot, refreshed from the Google Sheet in the background."""
 
 import sys
+import tempfile
+import threading
 from http.server import BaseHTTPRequestHandler
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
 # Ensure project root is on path when Vercel runs from api/
 _root = Path(__file__).resolve().parent.parent
 if str(_root) not in sys.path:
     sys.path.insert(0, str(_root))
 
+from job_tracker.config import SNAPSHOT_PATH
 from job_tracker.sheet_loader import load_jobs
+from job_tracker.snapshot import load_snapshot, refresh_snapshot, write_snapshot
 from job_tracker.web import build_html
 
+# Snapshot bundled at build time (read-only) and the one refreshes write (the deployment's only writable dir)
+_BUNDLED_SNAPSHOT = _root / SNAPSHOT_PATH
+_FRESH_SNAPSHOT = Path(tempfile.gettempdir()) / Path(SNAPSHOT_PATH).name
+# Older than this, a background thread re-fetches the sheet into a new snapshot
+_REFRESH_AFTER = 60
+# Older than this, the request fetches the sheet itself (once) and serves that
+_STALE_AFTER = 300
+# How long a stale request waits for a refresh already running on another thread
+_REFRESH_WAIT = 20
 
-class handler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        jobs = load_jobs(use_local_fallback=False)
+_refresh_lock = threading.Lock()
+
+
+def _newest(*snapshots):
+    loaded = [s for s in snapshots if s is not None]
+    return max(loaded, key=lambda s: s.version) if loaded else None
+
+
+_snapshot = _newest(load_snapshot(_BUNDLED_SNAPSHOT), load_snapshot(_FRESH_SNAPSHOT))
+
+
+def _is_stale(snapshot) -> bool:
+    return snapshot is None or snapshot.age() >= _STALE_AFTER
+
+
+def _fetch_into_snapshot() -> list[dict] | None:
+    """Fetch the sheet once and swap a snapshot of it in. Caller holds _refresh_lock.
+
+    Returns the fetched jobs (None if the sheet returned nothing), so a failed write can still serve them.
+    """
+    global _snapshot
+    jobs = load_jobs(use_local_fallback=False)
+    if not jobs:
+        return None
+    try:
+        write_snapshot(jobs, _FRESH_SNAPSHOT)
+        _snapshot = _newest(_snapshot, refresh_snapshot(_snapshot, _FRESH_SNAPSHOT))
+    except OSError:
+        pass
+    return jobs
+
+
+def _refresh() -> None:
+    try:
+        _fetch_into_snapshot()
+    except Exception:
+        pass
+    finally:
+        _refresh_lock.release()
+
+
+def _jobs_for(status: str | None) -> list[dict]:
+    """Jobs to render: from a fresh snapshot, else refreshed once on this request, else whatever is left."""
+    snapshot = _snapshot
+    if not _is_stale(snapshot):
+        if snapshot.age() >= _REFRESH_AFTER and _refresh_lock.acquire(blocking=False):
+            threading.Thread(target=_refresh, daemon=True).start()
+        return snapshot.jobs(status=status)
+    if _refresh_lock.acquire(timeout=_REFRESH_WAIT):
         try:
-            jobs = sorted(jobs, key=lambda j: int(j.get("id") or 0))
-        except (ValueError, TypeError):
+            # Another request may have refreshed while we waited for the lock
+            if _is_stale(_snapshot):
+                jobs = _fetch_into_snapshot()
+                if jobs is not None and _is_stale(_snapshot):
+                    return _sort_and_filter(jobs, status)
+        except Exception:
             pass
+        finally:
+            _refresh_lock.release()
+    # Sheet unreachable: stale data beats an empty page
+    return _snapshot.jobs(status=status) if _snapshot is not None else []
+
+
+def _sort_and_filter(jobs: list[dict], status: str | None) -> list[dict]:
+    try:
+        jobs = sorted(jobs, key=lambda j: int(j.get("id") or 0))
+    except (ValueError, TypeError):
+        pass
+    if status:
+        jobs = [j for j in jobs if j.get("status") == status]
+    return jobs
+
+
+class handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = (parse_qs(urlparse(self.path).query).get("status") or [None])[0]
+        jobs = _jobs_for(status)
         html = build_html(jobs)
         body = html.encode("utf-8")
         self.send_response(200)
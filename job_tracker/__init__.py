@@ -5,27 +5,39 @@ from job_tracker.config import (
     SHEET_COLUMNS,
     DB_PATH,
     LOCAL_CSV_PATH,
+    SNAPSHOT_PATH,
 )
 from job_tracker.db import (
     init_db,
     list_jobs,
     sync_from_sheet,
+    sync_changes,
     add_job,
     update_job,
     get_job_by_row_id,
+    find_duplicates,
+    duplicate_clusters,
 )
 from job_tracker.sheet_loader import load_jobs
+from job_tracker.snapshot import Snapshot, load_snapshot, write_snapshot
 
 __all__ = [
     "SPREADSHEET_ID",
     "SHEET_COLUMNS",
     "DB_PATH",
     "LOCAL_CSV_PATH",
+    "SNAPSHOT_PATH",
     "init_db",
     "list_jobs",
     "sync_from_sheet",
+    "sync_changes",
     "add_job",
     "update_job",
     "get_job_by_row_id",
+    "find_duplicates",
+    "duplicate_clusters",
     "load_jobs",
+    "Snapshot",
+    "load_snapshot",
+    "write_snapshot",
 ]
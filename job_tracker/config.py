@@ -26,3 +26,5 @@ SHEET_COLUMNS = [
 
 LOCAL_CSV_PATH = "jobs_export.csv"
 DB_PATH = "job_tracker.db"
+# Binary snapshot read by the Vercel handler; written by: python main.py snapshot
+SNAPSHOT_PATH = "jobs.snapshot"
@@ -1,7 +1,10 @@
 """SQLite storage for job applications. Mirrors Google Sheet columns."""
 
+import hashlib
+import re
 import sqlite3
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from job_tracker.config import DB_PATH, SHEET_COLUMNS
 
@@ -22,12 +25,49 @@ CREATE TABLE IF NOT EXISTS jobs (
     application_notes TEXT,
     salary_range TEXT,
     notes TEXT,
-    days_since_applied TEXT
+    days_since_applied TEXT,
+    fingerprint TEXT
 );
 CREATE INDEX IF NOT EXISTS idx_status ON jobs(status);
 CREATE INDEX IF NOT EXISTS idx_company ON jobs(company_name);
 """
 
+# Columns that identify a posting; changing any of them changes the row's fingerprint
+FINGERPRINT_COLUMNS = ("company_name", "job_title", "job_link", "location")
+_TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "ref", "refid", "trk", "trkinfo", "trackingid", "src", "gh_src"}
+
+
+def _canonical_text(s: str | None) -> str:
+    return re.sub(r"\s+", " ", (s or "").strip()).casefold()
+
+
+def _canonical_url(url: str | None) -> str:
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "://" in url else f"https://{url}")
+    host = parts.netloc.lower().removeprefix("www.")
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ]
+    return urlunsplit(("", host, parts.path.rstrip("/"), urlencode(sorted(query)), ""))
+
+
+def job_fingerprint(job: dict) -> str:
+    """Hash of canonical company + title + URL (tracking params dropped); empty for blank rows.
+
+    Without a URL the location stands in for it, so same-title postings in different cities stay distinct.
+    """
+    company = _canonical_text(job.get("company_name"))
+    title = _canonical_text(job.get("job_title"))
+    link = _canonical_url(job.get("job_link"))
+    if not (company or title or link):
+        return ""
+    where = link or _canonical_text(job.get("location"))
+    return hashlib.sha1(f"{company}\x1f{title}\x1f{where}".encode("utf-8")).hexdigest()
+
 
 def get_connection(path: str | Path | None = None):
     path = path or DB_PATH
@@ -36,21 +76,36 @@ def get_connection(path: str | Path | None = None):
     return conn
 
 
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Add and backfill the fingerprint column on databases created before it existed."""
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(jobs)")}
+    if "fingerprint" not in columns:
+        conn.execute("ALTER TABLE jobs ADD COLUMN fingerprint TEXT")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_fingerprint ON jobs(fingerprint)")
+    rows = conn.execute("SELECT * FROM jobs WHERE fingerprint IS NULL").fetchall()
+    conn.executemany(
+        "UPDATE jobs SET fingerprint = ? WHERE row_id = ?",
+        [(job_fingerprint(dict(r)), r["row_id"]) for r in rows],
+    )
+
+
 def init_db(conn: sqlite3.Connection | None = None):
     if conn is None:
         conn = get_connection()
         try:
             conn.executescript(SCHEMA)
+            _migrate(conn)
             conn.commit()
         finally:
             conn.close()
     else:
         conn.executescript(SCHEMA)
+        _migrate(conn)
         conn.commit()
 
 
 def row_to_dict(row: sqlite3.Row) -> dict:
-    d = {k: (row[k] or "") for k in row.keys() if k != "row_id"}
+    d = {k: (row[k] or "") for k in row.keys() if k not in ("row_id", "fingerprint")}
     d["row_id"] = row["row_id"]
     return d
 
@@ -62,10 +117,11 @@ def insert_jobs(jobs: list[dict], conn: sqlite3.Connection | None = None) -> int
     if own_conn:
         conn = get_connection()
     init_db(conn)
-    placeholders = ", ".join(["?" for _ in SHEET_COLUMNS])
-    columns = ", ".join(SHEET_COLUMNS)
+    placeholders = ", ".join(["?" for _ in SHEET_COLUMNS] + ["?"])
+    columns = ", ".join(SHEET_COLUMNS + ["fingerprint"])
     for j in jobs:
         values = [str(j.get(c, "") or "").strip() for c in SHEET_COLUMNS]
+        values.append(job_fingerprint(j))
         conn.execute(
             f"INSERT INTO jobs ({columns}) VALUES ({placeholders})",
             values,
@@ -87,12 +143,63 @@ def clear_jobs(conn: sqlite3.Connection | None = None) -> None:
         conn.close()
 
 
+def _sync_key(id_val: str | None, seen: dict[str, int]) -> tuple[str, int]:
+    """Match rows across syncs by sheet ID plus its occurrence number (blank IDs fall back to order)."""
+    id_val = (id_val or "").strip()
+    n = seen.get(id_val, 0)
+    seen[id_val] = n + 1
+    return id_val, n
+
+
+def sync_changes(jobs: list[dict], conn: sqlite3.Connection | None = None) -> dict[str, list[int]]:
+    """Bring the DB in line with the sheet in place, keeping row_ids of rows that still exist.
+
+    Returns the row_ids that were inserted, updated and deleted.
+    """
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    init_db(conn)
+    existing = {}
+    seen: dict[str, int] = {}
+    for row in conn.execute("SELECT * FROM jobs ORDER BY row_id ASC"):
+        existing[_sync_key(row["id"], seen)] = row
+    changes: dict[str, list[int]] = {"inserted": [], "updated": [], "deleted": []}
+    placeholders = ", ".join(["?" for _ in SHEET_COLUMNS] + ["?"])
+    columns = ", ".join(SHEET_COLUMNS + ["fingerprint"])
+    sets = ", ".join(f"{c} = ?" for c in SHEET_COLUMNS + ["fingerprint"])
+    seen = {}
+    for j in jobs:
+        values = [str(j.get(c, "") or "").strip() for c in SHEET_COLUMNS]
+        row = existing.pop(_sync_key(j.get("id"), seen), None)
+        if row is None:
+            cur = conn.execute(
+                f"INSERT INTO jobs ({columns}) VALUES ({placeholders})",
+                [*values, job_fingerprint(j)],
+            )
+            changes["inserted"].append(cur.lastrowid)
+        elif [row[c] or "" for c in SHEET_COLUMNS] != values:
+            conn.execute(
+                f"UPDATE jobs SET {sets} WHERE row_id = ?",
+                [*values, job_fingerprint(j), row["row_id"]],
+            )
+            changes["updated"].append(row["row_id"])
+    changes["deleted"] = [row["row_id"] for row in existing.values()]
+    conn.executemany("DELETE FROM jobs WHERE row_id = ?", [(r,) for r in changes["deleted"]])
+    conn.commit()
+    if own_conn:
+        conn.close()
+    return changes
+
+
 def sync_from_sheet(jobs: list[dict], conn: sqlite3.Connection | None = None) -> int:
-    clear_jobs(conn=conn)
-    return insert_jobs(jobs, conn=conn)
+    sync_changes(jobs, conn=conn)
+    return len(jobs)
 
 
-def _build_where(status: str | None, company: str | None, limit: int | None) -> tuple[str, list]:
+def _build_where(
+    status: str | None, company: str | None, limit: int | None, columns: str = "*"
+) -> tuple[str, list]:
     where, params = [], []
     if status:
         where.append("status = ?")
@@ -100,7 +207,7 @@ def _build_where(status: str | None, company: str | None, limit: int | None) ->
     if company:
         where.append("company_name LIKE ?")
         params.append(f"%{company}%")
-    sql = "SELECT * FROM jobs"
+    sql = f"SELECT {columns} FROM jobs"
     if where:
         sql += " WHERE " + " AND ".join(where)
     sql += " ORDER BY CAST(id AS INTEGER) ASC, row_id ASC"
@@ -127,10 +234,56 @@ def list_jobs(
     return out
 
 
+def list_row_ids(conn: sqlite3.Connection | None = None) -> list[int]:
+    """row_ids in display order, without loading row data."""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    sql, params = _build_where(None, None, None, columns="row_id")
+    cur = conn.execute(sql, params)
+    out = [r["row_id"] for r in cur.fetchall()]
+    if own_conn:
+        conn.close()
+    return out
+
+
 def add_job(job: dict, conn: sqlite3.Connection | None = None) -> None:
     insert_jobs([job], conn=conn)
 
 
+def find_duplicates(job: dict, conn: sqlite3.Connection | None = None) -> list[dict]:
+    """Existing jobs with the same fingerprint as `job`, looked up through idx_fingerprint."""
+    fp = job_fingerprint(job)
+    if not fp:
+        return []
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    init_db(conn)
+    cur = conn.execute("SELECT * FROM jobs WHERE fingerprint = ? ORDER BY row_id ASC", (fp,))
+    out = [row_to_dict(r) for r in cur.fetchall()]
+    if own_conn:
+        conn.close()
+    return out
+
+
+def duplicate_clusters(conn: sqlite3.Connection | None = None) -> list[list[int]]:
+    """row_ids of every group of jobs sharing a fingerprint, in one GROUP BY over the index."""
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    init_db(conn)
+    cur = conn.execute(
+        "SELECT GROUP_CONCAT(row_id) AS row_ids FROM jobs"
+        " WHERE fingerprint != '' GROUP BY fingerprint HAVING COUNT(*) > 1"
+    )
+    out = [sorted(int(r) for r in row["row_ids"].split(",")) for row in cur.fetchall()]
+    out.sort()
+    if own_conn:
+        conn.close()
+    return out
+
+
 def update_job(row_id: int, updates: dict, conn: sqlite3.Connection | None = None) -> bool:
     if not updates:
         return False
@@ -151,13 +304,30 @@ def update_job(row_id: int, updates: dict, conn: sqlite3.Connection | None = Non
         f"UPDATE jobs SET {', '.join(sets)} WHERE row_id = ?",
         params,
     )
-    conn.commit()
     ok = cur.rowcount > 0
+    if ok and allowed.intersection(updates).intersection(FINGERPRINT_COLUMNS):
+        row = conn.execute("SELECT * FROM jobs WHERE row_id = ?", (row_id,)).fetchone()
+        conn.execute("UPDATE jobs SET fingerprint = ? WHERE row_id = ?", (job_fingerprint(dict(row)), row_id))
+    conn.commit()
     if own_conn:
         conn.close()
     return ok
 
 
+def get_jobs_by_row_ids(row_ids: list[int], conn: sqlite3.Connection | None = None) -> list[dict]:
+    if not row_ids:
+        return []
+    own_conn = conn is None
+    if own_conn:
+        conn = get_connection()
+    placeholders = ", ".join(["?" for _ in row_ids])
+    cur = conn.execute(f"SELECT * FROM jobs WHERE row_id IN ({placeholders})", list(row_ids))
+    out = [row_to_dict(r) for r in cur.fetchall()]
+    if own_conn:
+        conn.close()
+    return out
+
+
 def get_job_by_row_id(row_id: int, conn: sqlite3.Connection | None = None) -> dict | None:
     if conn is None:
         conn = get_connection()
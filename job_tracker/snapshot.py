@@ -0,0 +1,185 @@
+"""Immutable binary snapshot of the job list for serverless reads (no SQLite, no CSV parsing).
+
+Layout (little-endian):
+    header      magic(8) version(u64) row_count(u32) col_count(u32) status_index_offset(u32) id_index_offset(u32)
+    row table   row_count * u32 absolute offset of each row
+    rows        per row, per column in SHEET_COLUMNS: u32 length + UTF-8 bytes
+    status idx  u32 count; per status: u16 length + bytes, u32 n, n * u32 row number
+    id idx      u32 count; per id: u16 length + bytes, u32 row number
+
+Rows are stored pre-sorted by numeric ID, so row numbers in the indexes come out in display order.
+"""
+
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+
+from job_tracker.config import SHEET_COLUMNS, SNAPSHOT_PATH
+
+MAGIC = b"JTSNAP01"
+_HEADER = struct.Struct("<8sQIIII")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+
+def _sort_key(job: dict) -> tuple[int, int]:
+    try:
+        return 0, int(job.get("id") or 0)
+    except (ValueError, TypeError):
+        return 1, 0
+
+
+def _pack_str16(s: str) -> bytes:
+    # Cut to the u16 limit without splitting a multi-byte character
+    b = s.encode("utf-8")[:0xFFFF].decode("utf-8", errors="ignore").encode("utf-8")
+    return _U16.pack(len(b)) + b
+
+
+def write_snapshot(jobs: list[dict], path: str | Path | None = None) -> int:
+    """Write jobs to a new snapshot file atomically; returns its version stamp (write time in ns)."""
+    path = Path(path or SNAPSHOT_PATH)
+    jobs = sorted(jobs, key=_sort_key)
+    version = time.time_ns()
+    table_size = _U32.size * len(jobs)
+    offset = _HEADER.size + table_size
+    offsets, rows = [], []
+    by_status: dict[str, list[int]] = {}
+    by_id: dict[str, int] = {}
+    for i, j in enumerate(jobs):
+        parts = []
+        for c in SHEET_COLUMNS:
+            b = str(j.get(c, "") or "").strip().encode("utf-8")
+            parts.append(_U32.pack(len(b)) + b)
+        row = b"".join(parts)
+        offsets.append(offset)
+        rows.append(row)
+        offset += len(row)
+        by_status.setdefault(str(j.get("status") or "").strip(), []).append(i)
+        id_val = str(j.get("id") or "").strip()
+        if id_val:
+            by_id.setdefault(id_val, i)
+    status_index = [_U32.pack(len(by_status))]
+    for status, members in by_status.items():
+        status_index.append(_pack_str16(status) + _U32.pack(len(members)))
+        status_index.append(struct.pack(f"<{len(members)}I", *members))
+    status_index_offset = offset
+    offset += sum(len(b) for b in status_index)
+    id_index = [_U32.pack(len(by_id))]
+    for id_val, i in sorted(by_id.items()):
+        id_index.append(_pack_str16(id_val) + _U32.pack(i))
+    header = _HEADER.pack(MAGIC, version, len(jobs), len(SHEET_COLUMNS), status_index_offset, offset)
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        f.writelines(rows)
+        f.writelines(status_index)
+        f.writelines(id_index)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return version
+
+
+def read_version(path: str | Path | None = None) -> int | None:
+    """Version stamp of the snapshot on disk, reading only its header."""
+    try:
+        with open(path or SNAPSHOT_PATH, "rb") as f:
+            magic, version, *_ = _HEADER.unpack(f.read(_HEADER.size))
+    except (OSError, struct.error):
+        return None
+    return version if magic == MAGIC else None
+
+
+class Snapshot:
+    """Read-only view over a memory-mapped snapshot; rows are decoded only when requested."""
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path or SNAPSHOT_PATH)
+        with open(self.path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.version, self.row_count, col_count, status_off, id_off = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or col_count != len(SHEET_COLUMNS):
+            self._buf.close()
+            raise ValueError(f"Not a compatible snapshot: {self.path}")
+        self._offsets = struct.unpack_from(f"<{self.row_count}I", self._buf, _HEADER.size)
+        self._by_status = self._read_status_index(status_off)
+        self._by_id = self._read_id_index(id_off)
+
+    def _read_str16(self, pos: int) -> tuple[str, int]:
+        (n,) = _U16.unpack_from(self._buf, pos)
+        pos += _U16.size
+        return self._buf[pos : pos + n].decode("utf-8"), pos + n
+
+    def _read_status_index(self, pos: int) -> dict[str, tuple[int, ...]]:
+        (count,) = _U32.unpack_from(self._buf, pos)
+        pos += _U32.size
+        out = {}
+        for _ in range(count):
+            status, pos = self._read_str16(pos)
+            (n,) = _U32.unpack_from(self._buf, pos)
+            pos += _U32.size
+            out[status] = struct.unpack_from(f"<{n}I", self._buf, pos)
+            pos += _U32.size * n
+        return out
+
+    def _read_id_index(self, pos: int) -> dict[str, int]:
+        (count,) = _U32.unpack_from(self._buf, pos)
+        pos += _U32.size
+        out = {}
+        for _ in range(count):
+            id_val, pos = self._read_str16(pos)
+            (out[id_val],) = _U32.unpack_from(self._buf, pos)
+            pos += _U32.size
+        return out
+
+    def age(self) -> float:
+        """Seconds since this snapshot was written."""
+        return (time.time_ns() - self.version) / 1e9
+
+    def row(self, i: int) -> dict:
+        pos = self._offsets[i]
+        out = {}
+        for c in SHEET_COLUMNS:
+            (n,) = _U32.unpack_from(self._buf, pos)
+            pos += _U32.size
+            out[c] = self._buf[pos : pos + n].decode("utf-8")
+            pos += n
+        return out
+
+    def statuses(self) -> list[str]:
+        return list(self._by_status)
+
+    def jobs(self, status: str | None = None) -> list[dict]:
+        """All rows in ID order, or only those with the given status (via the status index)."""
+        if status:
+            return [self.row(i) for i in self._by_status.get(status, ())]
+        return [self.row(i) for i in range(self.row_count)]
+
+    def get(self, id_val: str) -> dict | None:
+        i = self._by_id.get(str(id_val).strip())
+        return self.row(i) if i is not None else None
+
+    def close(self) -> None:
+        self._buf.close()
+
+
+def load_snapshot(path: str | Path | None = None) -> Snapshot | None:
+    try:
+        return Snapshot(path)
+    except (OSError, ValueError, struct.error):
+        return None
+
+
+def refresh_snapshot(current: Snapshot | None, path: str | Path | None = None) -> Snapshot | None:
+    """Return a new Snapshot if the file on disk has a different version, else `current`.
+
+    The old mapping is left open for any reader still holding it; it is released once unreferenced.
+    """
+    version = read_version(path)
+    if version is None or (current is not None and current.version == version):
+        return current
+    return load_snapshot(path) or current
@@ -2,15 +2,76 @@
 
 import html
 import http.server
+import json
 import os
+import queue
 import socketserver
+import threading
+import time
 from datetime import date, datetime
+from urllib.parse import parse_qs, urlsplit
 
-from job_tracker.db import init_db, list_jobs, sync_from_sheet
+from job_tracker.db import get_jobs_by_row_ids, init_db, list_jobs, list_row_ids, sync_changes
 from job_tracker.sheet_loader import load_jobs
 
 PORT = int(os.environ.get("PORT", 8000))
 SYNC_ON_LOAD = os.environ.get("SYNC_ON_LOAD", "1").lower() in ("1", "true", "yes")
+# Seconds between background syncs while at least one tab is listening on /events (needs SYNC_ON_LOAD)
+SYNC_INTERVAL = int(os.environ.get("SYNC_INTERVAL", 60))
+# Page loads within this many seconds of the last sync reuse it instead of fetching the sheet again
+SYNC_MIN_AGE = int(os.environ.get("SYNC_MIN_AGE", 10))
+KEEPALIVE_SECONDS = 15
+
+EMPTY_ROW = "<tr class='empty'><td colspan='8'>No jobs yet. Run: python main.py sync</td></tr>"
+
+# Patches the table in place from /events: drop deleted rows, swap updated ones, then reorder.
+# A "reset" event (sent when the tab missed events, e.g. after a reconnect) replaces the whole tbody.
+LIVE_SCRIPT = """<script>
+(function () {
+  if (!window.EventSource) return;
+  var tbody = document.querySelector("tbody");
+  var emptyRow = __EMPTY_ROW__;
+  var source = new EventSource("/events?since=" + encodeURIComponent(__SINCE__));
+  function parseRow(html) {
+    var tmp = document.createElement("tbody");
+    tmp.innerHTML = html;
+    return tmp.firstElementChild;
+  }
+  function fillIfEmpty() {
+    if (!tbody.querySelector("tr")) tbody.appendChild(parseRow(emptyRow));
+  }
+  source.addEventListener("reset", function (e) {
+    var msg = JSON.parse(e.data);
+    tbody.innerHTML = "";
+    msg.order.forEach(function (id) { tbody.appendChild(parseRow(msg.rows[id])); });
+    fillIfEmpty();
+  });
+  source.addEventListener("changes", function (e) {
+    var msg = JSON.parse(e.data);
+    var byId = {};
+    Array.prototype.forEach.call(tbody.querySelectorAll("tr[data-row-id]"), function (tr) {
+      byId[tr.getAttribute("data-row-id")] = tr;
+    });
+    msg.deleted.forEach(function (id) {
+      if (byId[id]) { byId[id].remove(); delete byId[id]; }
+    });
+    Object.keys(msg.rows).forEach(function (id) {
+      var tr = parseRow(msg.rows[id]);
+      if (byId[id]) byId[id].replaceWith(tr);
+      byId[id] = tr;
+    });
+    if (msg.inserted.length || msg.deleted.length) {
+      var empty = tbody.querySelector("tr.empty");
+      if (empty) empty.remove();
+      msg.order.forEach(function (id) {
+        if (byId[id]) tbody.appendChild(byId[id]);
+      });
+    }
+    fillIfEmpty();
+  });
+})();
+</script>
+"""
 
 
 def _days_since_applied(app_date: str) -> str:
@@ -24,29 +85,38 @@ def _days_since_applied(app_date: str) -> str:
         return ""
 
 
-def build_html(jobs: list[dict]) -> str:
-    def esc(s: str) -> str:
-        return html.escape(str(s or "").strip())
-
-    rows = []
-    for j in jobs:
-        company = esc(j.get("company_name"))
-        title = esc(j.get("job_title"))
-        location = esc(j.get("location"))
-        status = esc(j.get("status"))
-        date_val = esc(j.get("application_date"))
-        link = (j.get("job_link") or "").strip()
-        id_val = esc(j.get("id"))
-        days = (j.get("days_since_applied") or "").strip() or _days_since_applied(j.get("application_date") or "")
-        days_cell = esc(days) if days else "—"
-        link_cell = f'<a href="{esc(link)}" target="_blank" rel="noopener">Link</a>' if link else "—"
-        is_rejected = status.lower() == "rejected"
-        row_class = ' class="rejected"' if is_rejected else ""
-        rows.append(
-            f"<tr{row_class}><td>{id_val}</td><td>{company}</td><td>{title}</td>"
-            f"<td>{location}</td><td>{status}</td><td>{date_val}</td><td>{days_cell}</td><td>{link_cell}</td></tr>"
-        )
-    body = "\n".join(rows) if rows else "<tr><td colspan='8'>No jobs yet. Run: python main.py sync</td></tr>"
+def _esc(s: str) -> str:
+    return html.escape(str(s or "").strip())
+
+
+def render_row(j: dict) -> str:
+    """Render one job as a <tr>; rows from the DB carry their row_id for live patching."""
+    company = _esc(j.get("company_name"))
+    title = _esc(j.get("job_title"))
+    location = _esc(j.get("location"))
+    status = _esc(j.get("status"))
+    date_val = _esc(j.get("application_date"))
+    link = (j.get("job_link") or "").strip()
+    id_val = _esc(j.get("id"))
+    days = (j.get("days_since_applied") or "").strip() or _days_since_applied(j.get("application_date") or "")
+    days_cell = _esc(days) if days else "—"
+    link_cell = f'<a href="{_esc(link)}" target="_blank" rel="noopener">Link</a>' if link else "—"
+    is_rejected = status.lower() == "rejected"
+    row_class = ' class="rejected"' if is_rejected else ""
+    row_attr = f' data-row-id="{j["row_id"]}"' if j.get("row_id") is not None else ""
+    return (
+        f"<tr{row_attr}{row_class}><td>{id_val}</td><td>{company}</td><td>{title}</td>"
+        f"<td>{location}</td><td>{status}</td><td>{date_val}</td><td>{days_cell}</td><td>{link_cell}</td></tr>"
+    )
+
+
+def build_html(jobs: list[dict], live_since: str | None = None) -> str:
+    """Render the page; with live_since (the event id the jobs reflect) it also subscribes to /events."""
+    rows = [render_row(j) for j in jobs]
+    body = "\n".join(rows) if rows else EMPTY_ROW
+    script = ""
+    if live_since is not None:
+        script = LIVE_SCRIPT.replace("__EMPTY_ROW__", json.dumps(EMPTY_ROW)).replace("__SINCE__", json.dumps(live_since))
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -142,39 +212,166 @@ def build_html(jobs: list[dict]) -> str:
       </table>
     </div>
   </div>
-</body>
+{script}</body>
 </html>"""
 
 
+class _Broker:
+    """Fans one encoded SSE event out to every subscribed /events connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: list[queue.Queue] = []
+
+    def subscribe(self) -> queue.Queue:
+        q = queue.Queue()
+        with self._lock:
+            self._subscribers.append(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue) -> None:
+        with self._lock:
+            if q in self._subscribers:
+                self._subscribers.remove(q)
+
+    def has_subscribers(self) -> bool:
+        with self._lock:
+            return bool(self._subscribers)
+
+    def publish(self, event: bytes) -> None:
+        with self._lock:
+            for q in self._subscribers:
+                q.put(event)
+
+
+_broker = _Broker()
+_sync_lock = threading.Lock()
+_last_sync = 0.0
+# Event ids are "<server start>-<sync number>" so ids from before a restart never match
+_epoch = str(time.time_ns())
+_sync_seq = 0
+
+
+def _event_id() -> str:
+    return f"{_epoch}-{_sync_seq}"
+
+
+def _encode_reset() -> bytes:
+    jobs = list_jobs()
+    payload = {
+        "rows": {j["row_id"]: render_row(j) for j in jobs},
+        "order": [j["row_id"] for j in jobs],
+    }
+    return f"id: {_event_id()}\nevent: reset\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+
+
+def _encode_changes(changes: dict[str, list[int]]) -> bytes:
+    changed = changes["inserted"] + changes["updated"]
+    payload = {
+        "inserted": changes["inserted"],
+        "updated": changes["updated"],
+        "deleted": changes["deleted"],
+        "rows": {j["row_id"]: render_row(j) for j in get_jobs_by_row_ids(changed)},
+        "order": list_row_ids() if changes["inserted"] or changes["deleted"] else [],
+    }
+    return f"id: {_event_id()}\nevent: changes\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+
+
+def sync_and_publish(force: bool = False) -> None:
+    """Sync from the sheet once and push changed rows to every open tab.
+
+    Concurrent callers share one sync; unless forced, a sync younger than SYNC_MIN_AGE is reused.
+    """
+    global _last_sync, _sync_seq
+    with _sync_lock:
+        if not force and time.monotonic() - _last_sync < SYNC_MIN_AGE:
+            return
+        try:
+            sheet_data = load_jobs(use_local_fallback=True)
+            if not sheet_data:
+                return
+            changes = sync_changes(sheet_data)
+        except Exception:
+            return
+        _last_sync = time.monotonic()
+        if any(changes.values()):
+            _sync_seq += 1
+            if _broker.has_subscribers():
+                _broker.publish(_encode_changes(changes))
+
+
+def _sync_loop() -> None:
+    while True:
+        time.sleep(SYNC_INTERVAL)
+        if _broker.has_subscribers():
+            sync_and_publish(force=True)
+
+
 class _Handler(http.server.BaseHTTPRequestHandler):
     def do_GET(self):
-        if self.path not in ("/", "/index.html"):
+        url = urlsplit(self.path)
+        if url.path == "/events":
+            since = self.headers.get("Last-Event-ID") or (parse_qs(url.query).get("since") or [""])[0]
+            self._stream_events(since)
+            return
+        if url.path not in ("/", "/index.html"):
             self.send_error(404)
             return
         init_db()
         if SYNC_ON_LOAD:
-            try:
-                sheet_data = load_jobs(use_local_fallback=True)
-                if sheet_data:
-                    sync_from_sheet(sheet_data)
-            except Exception:
-                pass
+            sync_and_publish()
+        # Read the id before the rows: a sync in between makes the tab resync rather than miss it.
+        # Without SYNC_ON_LOAD nothing is ever published, so the page doesn't subscribe.
+        since = _event_id() if SYNC_ON_LOAD else None
         jobs = list_jobs()
-        html_bytes = build_html(jobs).encode("utf-8")
+        html_bytes = build_html(jobs, live_since=since).encode("utf-8")
         self.send_response(200)
         self.send_header("Content-Type", "text/html; charset=utf-8")
         self.send_header("Content-Length", str(len(html_bytes)))
         self.end_headers()
         self.wfile.write(html_bytes)
 
+    def _stream_events(self, since: str):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        # Subscribe under the sync lock so no sync can publish between the id check and the subscription
+        with _sync_lock:
+            q = _broker.subscribe()
+            reset = _encode_reset() if since != _event_id() else None
+        try:
+            if reset:
+                self.wfile.write(reset)
+                self.wfile.flush()
+            while True:
+                try:
+                    event = q.get(timeout=KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    event = b": keepalive\n\n"
+                self.wfile.write(event)
+                self.wfile.flush()
+        except OSError:
+            # Tab closed or connection dropped
+            pass
+        finally:
+            _broker.unsubscribe(q)
+
     def log_message(self, format, *args):
         pass
 
 
+class _Server(socketserver.ThreadingTCPServer):
+    # /events connections stay open, so each request gets its own thread
+    daemon_threads = True
+
+
 def run_server(open_browser: bool = True):
     init_db()
     host = "0.0.0.0" if os.environ.get("PORT") else "127.0.0.1"
-    with socketserver.TCPServer((host, PORT), _Handler) as httpd:
+    if SYNC_ON_LOAD:
+        threading.Thread(target=_sync_loop, daemon=True).start()
+    with _Server((host, PORT), _Handler) as httpd:
         url = f"http://localhost:{PORT}" if host == "127.0.0.1" else f"http://0.0.0.0:{PORT}"
         print(f"Open in browser: {url}")
         if open_browser and host == "127.0.0.1":
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""CLI entry point. Run: python main.py sync | list | add | update | show | open"""
+"""CLI entry point. Run: python main.py sync | snapshot | list | add | update | show | dedupe | open"""
 
 import sys
 from pathlib import Path
@@ -13,6 +13,7 @@ import webbrowser
 
 from job_tracker.config import SPREADSHEET_ID
 from job_tracker.sheet_loader import load_jobs
+from job_tracker.snapshot import write_snapshot
 from job_tracker.db import (
     init_db,
     sync_from_sheet,
@@ -20,6 +21,9 @@ from job_tracker.db import (
     add_job,
     update_job,
     get_job_by_row_id,
+    get_jobs_by_row_ids,
+    find_duplicates,
+    duplicate_clusters,
 )
 
 
@@ -31,6 +35,27 @@ def cmd_sync(args):
         return 1
     n = sync_from_sheet(jobs)
     print(f"Synced {n} job(s) from sheet.")
+    clusters = duplicate_clusters()
+    if clusters:
+        print(f"Warning: {len(clusters)} group(s) of duplicate jobs. Run: python main.py dedupe")
+    return 0
+
+
+def cmd_snapshot(args):
+    if args.from_db:
+        init_db()
+        jobs = db_list_jobs()
+    else:
+        jobs = load_jobs(use_local_fallback=True)
+    if not jobs:
+        if args.from_db:
+            print("No jobs in the DB to snapshot. Run: python main.py sync")
+        else:
+            print("No data loaded. Ensure the sheet is shared as 'Anyone with the link can view',")
+            print("or download it as CSV and save as jobs_export.csv in this folder.")
+        return 0 if args.allow_empty else 1
+    version = write_snapshot(jobs, args.output)
+    print(f"Wrote snapshot of {len(jobs)} job(s) (version {version}).")
     return 0
 
 
@@ -74,6 +99,12 @@ def cmd_add(args):
         "notes": "",
         "days_since_applied": "",
     }
+    dupes = find_duplicates(job)
+    if dupes and not args.force:
+        print("Already tracked (use --force to add anyway):")
+        for d in dupes:
+            print(f"  [{d['row_id']}] {d.get('company_name')} — {d.get('job_title')}  |  {d.get('status')}")
+        return 1
     add_job(job)
     print("Added job:", job.get("company_name"), "—", job.get("job_title"))
     return 0
@@ -110,6 +141,21 @@ def cmd_show(args):
     return 0
 
 
+def cmd_dedupe(args):
+    clusters = duplicate_clusters()
+    if not clusters:
+        print("No duplicate jobs found.")
+        return 0
+    for row_ids in clusters:
+        jobs = sorted(get_jobs_by_row_ids(row_ids), key=lambda j: j["row_id"])
+        first = jobs[0]
+        print(f"{first.get('company_name')} — {first.get('job_title')}")
+        for j in jobs:
+            print(f"  [{j['row_id']}] {j.get('status')}  |  {j.get('application_date')}  |  {j.get('job_link')}")
+    print(f"\nDuplicate groups: {len(clusters)}")
+    return 0
+
+
 def cmd_open_sheet(args):
     url = f"https://docs.google.com/spreadsheets/d/{SPREADSHEET_ID}/edit"
     webbrowser.open(url)
@@ -122,6 +168,14 @@ def main():
 
     sub.add_parser("sync", help="Sync from Google Sheet / local CSV into DB").set_defaults(func=cmd_sync)
 
+    snap_p = sub.add_parser("snapshot", help="Write the binary snapshot used by the Vercel handler")
+    snap_p.add_argument("--from-db", action="store_true", help="Snapshot the local DB instead of the sheet")
+    snap_p.add_argument(
+        "--allow-empty", action="store_true", help="Exit 0 when there is no data (e.g. the sheet is unreachable at build time)"
+    )
+    snap_p.add_argument("--output", "-o", help="Snapshot path (default: jobs.snapshot)")
+    snap_p.set_defaults(func=cmd_snapshot)
+
     list_p = sub.add_parser("list", help="List jobs")
     list_p.add_argument("--status", "-s", help="Filter by status")
     list_p.add_argument("--company", "-c", help="Filter by company name (substring)")
@@ -140,6 +194,7 @@ def main():
     add_p.add_argument("--follow-up", help="Follow-up date")
     add_p.add_argument("--notes", "-n", help="Notes")
     add_p.add_argument("--id", help="Optional ID")
+    add_p.add_argument("--force", action="store_true", help="Add even if the job is already tracked")
     add_p.set_defaults(func=cmd_add)
 
     up_p = sub.add_parser("update", help="Update a job by row_id")
@@ -153,6 +208,8 @@ def main():
     show_p.add_argument("row_id", type=int, help="row_id from list")
     show_p.set_defaults(func=cmd_show)
 
+    sub.add_parser("dedupe", help="Find jobs tracked more than once").set_defaults(func=cmd_dedupe)
+
     sub.add_parser("open", help="Open Google Sheet in browser").set_defaults(func=cmd_open_sheet)
 
     args = p.parse_args()